@@ -0,0 +1,102 @@
+from asgiref.sync import async_to_sync, sync_to_async
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+import os
+import sys
+
+from skillswap import create_app, mark_ready, prime_pools
+
+# Tryb ASGI: uvicorn asgi:application
+# To serwer wątkowy, nie nieblokujące I/O - każde żądanie zajmuje wątek (najwyżej ASGI_THREADS naraz).
+# Schemat bazy sprawdza się raz przed startem (README) - nie w każdym z procesów `--workers`
+app = create_app({'VERIFY_SCHEMA': False})
+
+executor = ThreadPoolExecutor(max_workers=int(os.getenv('ASGI_THREADS', 32)), thread_name_prefix='wsgi')
+
+def build_environ(scope, body):
+    root_path = scope.get('root_path', '')
+    path = scope['path'][len(root_path):] if scope['path'].startswith(root_path) else scope['path']
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf8').decode('latin1'),
+        'PATH_INFO': path.encode('utf8').decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('latin1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'REMOTE_ADDR': scope['client'][0] if scope.get('client') else '',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin1')
+        key = {'content-type': 'CONTENT_TYPE', 'content-length': 'CONTENT_LENGTH'}.get(name, 'HTTP_' + name.upper().replace('-', '_'))
+        value = value.decode('latin1')
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+# Wykonywane w wątku z puli - send to zsynchronizowany send serwera
+def run_wsgi(scope, body, send):
+    response = {'started': False}
+
+    def start_response(status, headers, exc_info=None):
+        if exc_info and response['started']:
+            raise exc_info[1].with_traceback(exc_info[2])
+        response['start'] = {
+            'type': 'http.response.start',
+            'status': int(status.split(' ', 1)[0]),
+            'headers': [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers]
+        }
+        return write
+
+    def write(data, more_body=True):
+        if not response['started']:
+            send(response['start'])
+            response['started'] = True
+        send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+
+    result = app(build_environ(scope, body), start_response)
+    try:
+        for chunk in result:
+            if chunk:
+                write(chunk)
+    finally:
+        if hasattr(result, 'close'):
+            result.close()
+    write(b'', more_body=False)
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        # Uvicorn przyjmuje ruch dopiero po lifespan.startup.complete
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # Jak w gunicornie (post_worker_init) - błąd startu zatrzymuje serwer
+                try:
+                    prime_pools(app)
+                    mark_ready()
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        raise ValueError(f"Nieobsługiwany typ połączenia: {scope['type']}")
+    with SpooledTemporaryFile(max_size=65536) as body:
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body.write(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        body.seek(0)
+        await sync_to_async(run_wsgi, thread_sensitive=False, executor=executor)(scope, body, async_to_sync(send))
@@ -0,0 +1,214 @@
+"""Porównanie wdrożenia synchronicznego (gunicorn) i ASGI (uvicorn asgi:application).
+
+Dla każdej liczby równoczesnych połączeń mierzy przepustowość, opóźnienia,
+liczbę błędów/timeoutów oraz pamięć (RSS) procesów serwera w przeliczeniu na połączenie.
+Pomiar pamięci czyta /proc, więc działa tylko na Linuksie.
+Przed testem obciążeniowym mierzy czas startu serwera (do gotowości workera, nie do otwarcia portu)
+i opóźnienie pierwszych żądań z rozgrzewką (WARM_UP=1) i bez niej.
+
+    python benchmark.py --connections 10,100,500 --duration 10 > bench_output.txt
+"""
+from werkzeug.security import generate_password_hash
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+HOST = '127.0.0.1'
+PATHS = ['/profile', '/messages/2', '/search']
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SERVERS = {
+    'sync': lambda port, workers: ['gunicorn', '-c', os.path.join(HERE, 'gunicorn.conf.py'), '-w', str(workers), '-b', f'{HOST}:{port}', 'skillswap:create_app()'],
+    'asgi': lambda port, workers: ['uvicorn', 'asgi:application', '--workers', str(workers), '--host', HOST, '--port', str(port), '--log-level', 'warning'],
+}
+
+def seed(database_url, users):
+    from skillswap import create_app, db, User, Message
+    app = create_app({'SQLALCHEMY_DATABASE_URI': database_url, 'WARM_UP': False})
+    with app.app_context():
+        db.create_all()
+        password = generate_password_hash('benchmark')
+        for i in range(users):
+            db.session.add(User(username=f'user{i}', email=f'user{i}@example.com', password=password,
+                                skills_offered='fotografia,gotowanie', location='Warszawa', notifications=0))
+        db.session.flush()
+        for i in range(users * 5):
+            db.session.add(Message(sender_id=1 + i % 2, receiver_id=2 - i % 2, content=f'Wiadomość {i}'))
+        db.session.commit()
+
+def login(port):
+    # Ciasteczko sesji z odpowiedzi 302, bez podążania za przekierowaniem
+    class NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *args, **kwargs):
+            return None
+    opener = urllib.request.build_opener(NoRedirect)
+    data = urllib.parse.urlencode({'email': 'user0@example.com', 'password': 'benchmark'}).encode()
+    try:
+        opener.open(f'http://{HOST}:{port}/login', data=data)
+    except urllib.error.HTTPError as e:
+        return e.headers['Set-Cookie'].split(';')[0]
+    raise RuntimeError('Logowanie nie zwróciło przekierowania')
+
+def wait_for_server(port, timeout=30):
+    # Gotowość = port przyjmuje połączenia, bez wysyłania żądania, żeby nie rozgrzać aplikacji
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'Serwer na porcie {port} nie wystartował')
+
+def start_server(mode, port, workers, env, cwd):
+    return subprocess.Popen(SERVERS[mode](port, workers), cwd=cwd, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def timed_get(port, path, cookie=None):
+    start = time.monotonic()
+    request = urllib.request.Request(f'http://{HOST}:{port}{path}', headers={'Cookie': cookie} if cookie else {})
+    urllib.request.urlopen(request).read()
+    return (time.monotonic() - start) * 1000
+
+def wait_for_file(path, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            return
+        time.sleep(0.01)
+    raise RuntimeError(f'Brak pliku gotowości {path}')
+
+def measure_startup(mode, port, env, cwd, repeats=10):
+    # Jeden worker, żeby pierwsze żądania trafiły do tego samego procesu.
+    # Gotowość = plik READY_FILE z post_worker_init (gunicorn) lub lifespan startup (uvicorn);
+    # sam port nie wystarcza, bo gunicorn nasłuchuje, zanim worker skończy start
+    ready_file = os.path.join(cwd, f'ready-{mode}-{env["WARM_UP"]}')
+    if os.path.exists(ready_file):
+        os.remove(ready_file)
+    start = time.monotonic()
+    server = start_server(mode, port, 1, dict(env, READY_FILE=ready_file), cwd)
+    try:
+        wait_for_file(ready_file)
+        startup = time.monotonic() - start
+        wait_for_server(port)
+        first_index = timed_get(port, '/')
+        cookie = login(port)
+        first_profile = timed_get(port, '/profile', cookie)
+        steady = statistics.median(timed_get(port, '/profile', cookie) for _ in range(repeats))
+        return startup, first_index, first_profile, steady
+    finally:
+        server.terminate()
+        server.wait()
+
+def rss_kb(pid):
+    # RSS procesu i wszystkich jego potomków
+    children = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                pass
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+        except (OSError, StopIteration):
+            pass
+    return total
+
+async def fetch(port, path, cookie, timeout):
+    # Nowe połączenie na żądanie - sync workery gunicorna i tak nie obsługują keep-alive
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(HOST, port), timeout)
+    try:
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: {HOST}\r\nCookie: {cookie}\r\nConnection: close\r\n\r\n'.encode())
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+        return int(response.split(b' ', 2)[1])
+    finally:
+        writer.close()
+
+async def client(port, cookie, deadline, timeout, latencies, errors):
+    i = 0
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        try:
+            status = await fetch(port, PATHS[i % len(PATHS)], cookie, timeout)
+            if status == 200:
+                latencies.append(time.monotonic() - start)
+            else:
+                errors.append(status)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError) as e:
+            errors.append(type(e).__name__)
+        i += 1
+
+async def load(port, pid, cookie, connections, duration, timeout):
+    latencies, errors, peak_rss = [], [], 0
+    deadline = time.monotonic() + duration
+    tasks = [asyncio.create_task(client(port, cookie, deadline, timeout, latencies, errors)) for _ in range(connections)]
+    while not all(task.done() for task in tasks):
+        peak_rss = max(peak_rss, await asyncio.to_thread(rss_kb, pid))
+        await asyncio.sleep(0.5)
+    return latencies, errors, peak_rss
+
+def percentile(values, p):
+    return sorted(values)[min(len(values) - 1, int(len(values) * p))] if values else float('nan')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', default='sync,asgi')
+    parser.add_argument('--connections', default='10,100,500')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--timeout', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='skillswap-bench-')
+    database_url = os.getenv('DATABASE_URL') or f'sqlite:///{os.path.join(tmp, "bench.db")}'
+    seed(database_url, args.users)
+    # Schemat tworzy seed - DDL nie miesza się z porównaniem rozgrzewki
+    env = dict(os.environ, DATABASE_URL=database_url, PYTHONPATH=HERE, VERIFY_SCHEMA='0')
+
+    print(f'{"tryb":<6} {"rozgrzewka":>10} {"start s":>8} {"1. / ms":>8} {"1. profil ms":>13} {"profil ms":>10}')
+    for mode in args.modes.split(','):
+        for warm_up in ('0', '1'):
+            startup, first_index, first_profile, steady = measure_startup(mode, args.port, dict(env, WARM_UP=warm_up), tmp)
+            print(f'{mode:<6} {warm_up:>10} {startup:>8.2f} {first_index:>8.1f} {first_profile:>13.1f} {steady:>10.1f}', flush=True)
+    print()
+
+    print(f'{"tryb":<6} {"poł.":>6} {"req/s":>8} {"p50 ms":>8} {"p99 ms":>8} {"błędy":>7} {"RSS MB":>8} {"KB/poł.":>8}')
+    for mode in args.modes.split(','):
+        server = start_server(mode, args.port, args.workers, env, tmp)
+        try:
+            wait_for_server(args.port)
+            cookie = login(args.port)
+            idle_rss = rss_kb(server.pid)
+            for connections in map(int, args.connections.split(',')):
+                latencies, errors, peak_rss = asyncio.run(load(args.port, server.pid, cookie, connections, args.duration, args.timeout))
+                print(f'{mode:<6} {connections:>6} {len(latencies) / args.duration:>8.1f} '
+                      f'{statistics.median(latencies) * 1000 if latencies else float("nan"):>8.1f} '
+                      f'{percentile(latencies, 0.99) * 1000:>8.1f} {len(errors):>7} '
+                      f'{peak_rss / 1024:>8.1f} {max(0, peak_rss - idle_rss) / connections:>8.1f}', flush=True)
+        finally:
+            server.terminate()
+            server.wait()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+# Wczytywany automatycznie przez gunicorna z katalogu roboczego
+from skillswap import mark_ready, prime_pools
+
+# Aplikacja (szablony, schemat bazy) tworzona raz w procesie głównym i współdzielona przez fork,
+# więc sprawdzenie schematu i tworzenie indeksów wykonuje się tylko raz
+preload_app = True
+
+# Pula db.engine obsługuje wszystkie widoki; błąd (np. niedostępna baza) kończy start gunicorna
+def post_worker_init(worker):
+    prime_pools(worker.wsgi)
+    mark_ready()
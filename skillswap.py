@@ -1,22 +1,22 @@
-from flask import Flask, render_template_string, request, redirect, url_for, flash
+from flask import Flask, Blueprint, render_template, request, redirect, url_for, flash
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import inspect, text
+from jinja2 import DictLoader
 from datetime import datetime
 import logging
 import os
 import functools
+import time
 
 # Konfiguracja
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'super-secret-key-123')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///skillswap.db').replace('postgres://', 'postgresql://', 1)
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 logging.basicConfig(filename='skillswap.log', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-db = SQLAlchemy(app)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
+db = SQLAlchemy()
+login_manager = LoginManager()
+login_manager.login_view = 'skillswap.login'
+bp = Blueprint('skillswap', __name__)
 
 # Kategorie umiejętności
 SKILL_CATEGORIES = {
@@ -78,7 +78,7 @@ def handle_db_errors(func):
             db.session.rollback()
             logging.error(f'Błąd w {func.__name__}: {str(e)}')
             flash(f'Błąd: {str(e)}')
-            return redirect(url_for('index'))
+            return redirect(url_for('.index'))
     return wrapper
 
 def validate_form(form, is_register=True):
@@ -121,15 +121,15 @@ BASE_HTML = """
 <body>
     <div class="sidebar">
         <h4><i class="bi bi-share"></i> SkillSwap</h4>
-        <a href="{{ url_for('index') }}" class="btn btn-link"><i class="bi bi-house"></i> Strona główna</a><br>
+        <a href="{{ url_for('.index') }}" class="btn btn-link"><i class="bi bi-house"></i> Strona główna</a><br>
         {% if current_user.is_authenticated %}
-            <a href="{{ url_for('profile') }}" class="btn btn-link"><i class="bi bi-person"></i> Profil</a><br>
-            <a href="{{ url_for('search') }}" class="btn btn-link"><i class="bi bi-search"></i> Szukaj</a><br>
-            <a href="{{ url_for('messages') }}" class="btn btn-link"><i class="bi bi-chat"></i> Wiadomości {% if current_user.notifications %} ({{ current_user.notifications }}) {% endif %}</a><br>
-            <a href="{{ url_for('logout') }}" class="btn btn-link"><i class="bi bi-box-arrow-right"></i> Wyloguj</a>
+            <a href="{{ url_for('.profile') }}" class="btn btn-link"><i class="bi bi-person"></i> Profil</a><br>
+            <a href="{{ url_for('.search') }}" class="btn btn-link"><i class="bi bi-search"></i> Szukaj</a><br>
+            <a href="{{ url_for('.messages') }}" class="btn btn-link"><i class="bi bi-chat"></i> Wiadomości {% if current_user.notifications %} ({{ current_user.notifications }}) {% endif %}</a><br>
+            <a href="{{ url_for('.logout') }}" class="btn btn-link"><i class="bi bi-box-arrow-right"></i> Wyloguj</a>
         {% else %}
-            <a href="{{ url_for('login') }}" class="btn btn-link"><i class="bi bi-box-arrow-in-right"></i> Zaloguj</a><br>
-            <a href="{{ url_for('register') }}" class="btn btn-link"><i class="bi bi-person-plus"></i> Zarejestruj</a>
+            <a href="{{ url_for('.login') }}" class="btn btn-link"><i class="bi bi-box-arrow-in-right"></i> Zaloguj</a><br>
+            <a href="{{ url_for('.register') }}" class="btn btn-link"><i class="bi bi-person-plus"></i> Zarejestruj</a>
         {% endif %}
     </div>
     <div class="content">
@@ -199,7 +199,7 @@ REGISTER_HTML = """
         </div>
         <button type="submit" class="btn btn-primary"><i class="bi bi-person-plus"></i> Zarejestruj</button>
     </form>
-    <p class="text-center mt-3">Masz konto? <a href="{{ url_for('login') }}">Zaloguj się</a></p>
+    <p class="text-center mt-3">Masz konto? <a href="{{ url_for('.login') }}">Zaloguj się</a></p>
 {% endblock %}
 """
 
@@ -219,7 +219,7 @@ LOGIN_HTML = """
         </div>
         <button type="submit" class="btn btn-success"><i class="bi bi-box-arrow-in-right"></i> Zaloguj</button>
     </form>
-    <p class="text-center mt-3">Nie masz konta? <a href="{{ url_for('register') }}">Zarejestruj się</a></p>
+    <p class="text-center mt-3">Nie masz konta? <a href="{{ url_for('.register') }}">Zarejestruj się</a></p>
 {% endblock %}
 """
 
@@ -235,13 +235,13 @@ PROFILE_HTML = """
             <p><strong><i class="bi bi-search"></i> Umiejętności pożądane:</strong> {{ user.skills_wanted or "Brak" }}</p>
             <p><strong><i class="bi bi-geo-alt"></i> Lokalizacja:</strong> {{ user.location or "Brak" }}</p>
             <p><strong><i class="bi bi-star"></i> Ocena:</strong> {{ "%.1f" % user.rating if user.rating_count else "Brak ocen" }} ({{ user.rating_count }} ocen)</p>
-            <p><strong><i class="bi bi-coin"></i> Punkty:</strong> {{ user.points }} <a href="{{ url_for('buy_points') }}" class="btn btn-sm btn-warning"><i class="bi bi-cart"></i> Kup punkty</a></p>
+            <p><strong><i class="bi bi-coin"></i> Punkty:</strong> {{ user.points }} <a href="{{ url_for('.buy_points') }}" class="btn btn-sm btn-warning"><i class="bi bi-cart"></i> Kup punkty</a></p>
             <p><strong><i class="bi bi-award"></i> Odznaki:</strong> {{ user.badges or "Brak" }}</p>
             <p><strong><i class="bi bi-bar-chart"></i> Statystyki:</strong> Sesje: {{ stats.sessions }}, Wiadomości: {{ stats.messages }}</p>
             {% if user.id == current_user.id %}
-                <a href="{{ url_for('edit_profile') }}" class="btn btn-warning btn-sm"><i class="bi bi-pencil"></i> Edytuj profil</a>
+                <a href="{{ url_for('.edit_profile') }}" class="btn btn-warning btn-sm"><i class="bi bi-pencil"></i> Edytuj profil</a>
                 {% if user.notifications %}
-                    <a href="{{ url_for('clear_notifications') }}" class="btn btn-secondary btn-sm"><i class="bi bi-bell"></i> Wyczyść powiadomienia</a>
+                    <a href="{{ url_for('.clear_notifications') }}" class="btn btn-secondary btn-sm"><i class="bi bi-bell"></i> Wyczyść powiadomienia</a>
                 {% endif %}
             {% endif %}
         </div>
@@ -255,12 +255,12 @@ PROFILE_HTML = """
                     {{ session.teacher.username if session.student_id == current_user.id else session.student.username }} 
                     ({{ session.status }})
                     {% if session.status == 'pending' and session.teacher_id == current_user.id %}
-                        <a href="{{ url_for('update_session', session_id=session.id, action='accept') }}" class="btn btn-success btn-sm"><i class="bi bi-check"></i></a>
-                        <a href="{{ url_for('update_session', session_id=session.id, action='reject') }}" class="btn btn-danger btn-sm"><i class="bi bi-x"></i></a>
+                        <a href="{{ url_for('.update_session', session_id=session.id, action='accept') }}" class="btn btn-success btn-sm"><i class="bi bi-check"></i></a>
+                        <a href="{{ url_for('.update_session', session_id=session.id, action='reject') }}" class="btn btn-danger btn-sm"><i class="bi bi-x"></i></a>
                     {% elif session.status == 'accepted' %}
-                        <a href="{{ url_for('update_session', session_id=session.id, action='complete') }}" class="btn btn-primary btn-sm"><i class="bi bi-check-circle"></i></a>
+                        <a href="{{ url_for('.update_session', session_id=session.id, action='complete') }}" class="btn btn-primary btn-sm"><i class="bi bi-check-circle"></i></a>
                     {% elif session.status == 'completed' and session.student_id == current_user.id and not session.rating %}
-                        <form action="{{ url_for('rate_session', session_id=session.id) }}" method="POST" class="d-inline">
+                        <form action="{{ url_for('.rate_session', session_id=session.id) }}" method="POST" class="d-inline">
                             <select name="rating" required>
                                 <option value="1">1</option>
                                 <option value="2">2</option>
@@ -311,7 +311,7 @@ EDIT_PROFILE_HTML = """
         </div>
         <button type="submit" class="btn btn-primary"><i class="bi bi-save"></i> Zapisz</button>
     </form>
-    <p class="text-center mt-3"><a href="{{ url_for('profile') }}">Wróć do profilu</a></p>
+    <p class="text-center mt-3"><a href="{{ url_for('.profile') }}">Wróć do profilu</a></p>
 {% endblock %}
 """
 
@@ -352,10 +352,10 @@ SEARCH_HTML = """
         <ul class="list-group col-md-8 mx-auto">
             {% for user in users %}
                 <li class="list-group-item">
-                    <a href="{{ url_for('user_profile', user_id=user.id) }}"><strong>{{ user.username }}</strong></a> 
+                    <a href="{{ url_for('.user_profile', user_id=user.id) }}"><strong>{{ user.username }}</strong></a> 
                     ({{ user.skills_offered or "Brak" }} - {{ user.category or "Brak" }}) 
-                    <a href="{{ url_for('session', teacher_id=user.id) }}" class="btn btn-success btn-sm"><i class="bi bi-calendar"></i></a>
-                    <a href="{{ url_for('send_message', receiver_id=user.id) }}" class="btn btn-info btn-sm"><i class="bi bi-chat"></i></a>
+                    <a href="{{ url_for('.session', teacher_id=user.id) }}" class="btn btn-success btn-sm"><i class="bi bi-calendar"></i></a>
+                    <a href="{{ url_for('.send_message', receiver_id=user.id) }}" class="btn btn-info btn-sm"><i class="bi bi-chat"></i></a>
                 </li>
             {% endfor %}
         </ul>
@@ -376,7 +376,7 @@ SESSION_HTML = """
         </div>
         <button type="submit" class="btn btn-primary"><i class="bi bi-calendar"></i> Umów</button>
     </form>
-    <p class="text-center mt-3"><a href="{{ url_for('search') }}">Wróć do wyszukiwania</a></p>
+    <p class="text-center mt-3"><a href="{{ url_for('.search') }}">Wróć do wyszukiwania</a></p>
 {% endblock %}
 """
 
@@ -390,7 +390,7 @@ MESSAGES_HTML = """
         <ul class="list-group col-md-8 mx-auto">
             {% for conv in conversations %}
                 <li class="list-group-item">
-                    <a href="{{ url_for('messages', receiver_id=conv.user_id) }}"><strong>{{ conv.username }}</strong> {% if conv.unread %} ({{ conv.unread }}) {% endif %}</a>
+                    <a href="{{ url_for('.messages', receiver_id=conv.user_id) }}"><strong>{{ conv.username }}</strong> {% if conv.unread %} ({{ conv.unread }}) {% endif %}</a>
                 </li>
             {% endfor %}
         </ul>
@@ -405,7 +405,7 @@ MESSAGES_HTML = """
             {% endfor %}
         </ul>
         <h4 class="mt-4">Wyślij wiadomość</h4>
-        <form method="POST" action="{{ url_for('send_message', receiver_id=receiver_id) }}" class="col-md-6 mx-auto">
+        <form method="POST" action="{{ url_for('.send_message', receiver_id=receiver_id) }}" class="col-md-6 mx-auto">
             <div class="mb-3">
                 <label class="form-label">Treść</label>
                 <textarea name="content" class="form-control" required minlength="1"></textarea>
@@ -413,7 +413,7 @@ MESSAGES_HTML = """
             <button type="submit" class="btn btn-primary"><i class="bi bi-send"></i> Wyślij</button>
         </form>
     {% endif %}
-    <p class="text-center mt-3"><a href="{{ url_for('profile') }}">Wróć do profilu</a></p>
+    <p class="text-center mt-3"><a href="{{ url_for('.profile') }}">Wróć do profilu</a></p>
 {% endblock %}
 """
 
@@ -434,21 +434,35 @@ BUY_POINTS_HTML = """
         </div>
         <button type="submit" class="btn btn-primary"><i class="bi bi-cart"></i> Kup</button>
     </form>
-    <p class="text-center mt-3"><a href="{{ url_for('profile') }}">Wróć do profilu</a></p>
+    <p class="text-center mt-3"><a href="{{ url_for('.profile') }}">Wróć do profilu</a></p>
 {% endblock %}
 """
 
+# Szablony ładowane po nazwie, żeby Jinja kompilowała je raz i trzymała w cache
+TEMPLATES = {
+    'base.html': BASE_HTML,
+    'index.html': INDEX_HTML,
+    'register.html': REGISTER_HTML,
+    'login.html': LOGIN_HTML,
+    'profile.html': PROFILE_HTML,
+    'edit_profile.html': EDIT_PROFILE_HTML,
+    'search.html': SEARCH_HTML,
+    'session.html': SESSION_HTML,
+    'messages.html': MESSAGES_HTML,
+    'buy_points.html': BUY_POINTS_HTML
+}
+
 # Trasy
-@app.route('/')
+@bp.route('/')
 def index():
-    return render_template_string(INDEX_HTML)
+    return render_template('index.html')
 
-@app.route('/register', methods=['GET', 'POST'])
+@bp.route('/register', methods=['GET', 'POST'])
 @handle_db_errors
 def register():
     if request.method == 'POST':
         if not validate_form(request.form):
-            return redirect(url_for('register'))
+            return redirect(url_for('.register'))
         user = User(
             username=request.form['username'].strip(),
             email=request.form['email'].strip().lower(),
@@ -463,30 +477,30 @@ def register():
         db.session.commit()
         logging.info(f'Rejestracja: {user.username}')
         flash('Rejestracja udana! Zaloguj się.')
-        return redirect(url_for('login'))
-    return render_template_string(REGISTER_HTML, categories=SKILL_CATEGORIES.keys())
+        return redirect(url_for('.login'))
+    return render_template('register.html', categories=SKILL_CATEGORIES.keys())
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         user = User.query.filter_by(email=request.form['email'].lower()).first()
         if user and check_password_hash(user.password, request.form['password']):
             login_user(user)
             logging.info(f'Logowanie: {user.username}')
-            return redirect(url_for('profile'))
+            return redirect(url_for('.profile'))
         flash('Błędny email lub hasło!')
-        return redirect(url_for('login'))
-    return render_template_string(LOGIN_HTML)
+        return redirect(url_for('.login'))
+    return render_template('login.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 @login_required
 def logout():
     logging.info(f'Wylogowanie: {current_user.username}')
     logout_user()
-    return redirect(url_for('index'))
+    return redirect(url_for('.index'))
 
-@app.route('/profile')
-@app.route('/profile/<int:user_id>')
+@bp.route('/profile', endpoint='profile')
+@bp.route('/profile/<int:user_id>')
 @login_required
 def user_profile(user_id=None):
     user = User.query.get_or_404(user_id or current_user.id)
@@ -495,15 +509,15 @@ def user_profile(user_id=None):
         'sessions': len(sessions),
         'messages': Message.query.filter((Message.sender_id == user.id) | (Message.receiver_id == user.id)).count()
     }
-    return render_template_string(PROFILE_HTML, user=user, sessions=sessions, stats=stats)
+    return render_template('profile.html', user=user, sessions=sessions, stats=stats)
 
-@app.route('/edit_profile', methods=['GET', 'POST'])
+@bp.route('/edit_profile', methods=['GET', 'POST'])
 @login_required
 @handle_db_errors
 def edit_profile():
     if request.method == 'POST':
         if not validate_form(request.form, is_register=False):
-            return redirect(url_for('edit_profile'))
+            return redirect(url_for('.edit_profile'))
         current_user.username = request.form['username'].strip()
         current_user.skills_offered = request.form.get('skills_offered', '').strip() or None
         current_user.category = request.form.get('category', '') or None
@@ -512,10 +526,10 @@ def edit_profile():
         db.session.commit()
         logging.info(f'Edycja profilu: {current_user.username}')
         flash('Profil zaktualizowany!')
-        return redirect(url_for('profile'))
-    return render_template_string(EDIT_PROFILE_HTML, user=current_user, categories=SKILL_CATEGORIES)
+        return redirect(url_for('.profile'))
+    return render_template('edit_profile.html', user=current_user, categories=SKILL_CATEGORIES)
 
-@app.route('/search', methods=['GET', 'POST'])
+@bp.route('/search', methods=['GET', 'POST'])
 @login_required
 def search():
     if request.method == 'POST':
@@ -527,28 +541,28 @@ def search():
         if location := request.form.get('location', '').strip().lower():
             query = query.filter(User.location.ilike(f'%{location}%'))
         users = query.filter(User.id != current_user.id).all()
-        return render_template_string(SEARCH_HTML, users=users, categories=SKILL_CATEGORIES)
-    return render_template_string(SEARCH_HTML, categories=SKILL_CATEGORIES)
+        return render_template('search.html', users=users, categories=SKILL_CATEGORIES)
+    return render_template('search.html', categories=SKILL_CATEGORIES)
 
-@app.route('/session/<int:teacher_id>', methods=['GET', 'POST'])
+@bp.route('/session/<int:teacher_id>', methods=['GET', 'POST'])
 @login_required
 @handle_db_errors
 def session(teacher_id):
     teacher = User.query.get_or_404(teacher_id)
     if teacher_id == current_user.id:
         flash('Nie możesz umówić sesji z samym sobą!')
-        return redirect(url_for('search'))
+        return redirect(url_for('.search'))
     if request.method == 'POST':
         skill = request.form['skill'].strip()
         if len(skill) < 2:
             flash('Umiejętność musi mieć co najmniej 2 znaki!')
-            return redirect(url_for('session', teacher_id=teacher_id))
+            return redirect(url_for('.session', teacher_id=teacher_id))
         if current_user.points < 5:
             flash('Potrzeba 5 punktów!')
-            return redirect(url_for('session', teacher_id=teacher_id))
+            return redirect(url_for('.session', teacher_id=teacher_id))
         if Session.query.filter_by(teacher_id=teacher_id, student_id=current_user.id, status='pending').first():
             flash('Masz już oczekującą sesję!')
-            return redirect(url_for('profile'))
+            return redirect(url_for('.profile'))
         session = Session(teacher_id=teacher_id, student_id=current_user.id, skill=skill, category=teacher.category)
         current_user.points -= 5
         teacher.notifications += 1
@@ -556,17 +570,17 @@ def session(teacher_id):
         db.session.commit()
         logging.info(f'Sesja: {current_user.username} z {teacher.username}')
         flash('Sesja umówiona!')
-        return redirect(url_for('profile'))
-    return render_template_string(SESSION_HTML, teacher=teacher)
+        return redirect(url_for('.profile'))
+    return render_template('session.html', teacher=teacher)
 
-@app.route('/update_session/<int:session_id>/<action>')
+@bp.route('/update_session/<int:session_id>/<action>')
 @login_required
 @handle_db_errors
 def update_session(session_id, action):
     session = Session.query.get_or_404(session_id)
     if session.teacher_id != current_user.id:
         flash('Brak uprawnień!')
-        return redirect(url_for('profile'))
+        return redirect(url_for('.profile'))
     if action == 'accept':
         session.status = 'accepted'
     elif action == 'reject':
@@ -580,20 +594,20 @@ def update_session(session_id, action):
             teacher.badges = (teacher.badges or '') + ',Mistrz Nauczania'
     db.session.commit()
     flash(f'Sesja: {action}')
-    return redirect(url_for('profile'))
+    return redirect(url_for('.profile'))
 
-@app.route('/rate_session/<int:session_id>', methods=['POST'])
+@bp.route('/rate_session/<int:session_id>', methods=['POST'])
 @login_required
 @handle_db_errors
 def rate_session(session_id):
     session = Session.query.get_or_404(session_id)
     if session.student_id != current_user.id or session.status != 'completed' or session.rating:
         flash('Nie możesz ocenić tej sesji!')
-        return redirect(url_for('profile'))
+        return redirect(url_for('.profile'))
     rating = int(request.form['rating'])
     if rating < 1 or rating > 5:
         flash('Ocena od 1 do 5!')
-        return redirect(url_for('profile'))
+        return redirect(url_for('.profile'))
     session.rating = rating
     teacher = User.query.get(session.teacher_id)
     teacher.rating_count += 1
@@ -601,10 +615,10 @@ def rate_session(session_id):
     teacher.notifications += 1
     db.session.commit()
     flash('Sesja oceniona!')
-    return redirect(url_for('profile'))
+    return redirect(url_for('.profile'))
 
-@app.route('/messages', methods=['GET'])
-@app.route('/messages/<int:receiver_id>', methods=['GET', 'POST'])
+@bp.route('/messages', methods=['GET'])
+@bp.route('/messages/<int:receiver_id>', methods=['GET', 'POST'])
 @login_required
 @handle_db_errors
 def messages(receiver_id=None):
@@ -612,14 +626,14 @@ def messages(receiver_id=None):
         content = request.form['content'].strip()
         if not content:
             flash('Wiadomość nie może być pusta!')
-            return redirect(url_for('messages', receiver_id=receiver_id))
+            return redirect(url_for('.messages', receiver_id=receiver_id))
         receiver = User.query.get_or_404(receiver_id)
         db.session.add(Message(sender_id=current_user.id, receiver_id=receiver_id, content=content))
         receiver.notifications += 1
         current_user.points += 1
         db.session.commit()
         flash('Wiadomość wysłana!')
-        return redirect(url_for('messages', receiver_id=receiver_id))
+        return redirect(url_for('.messages', receiver_id=receiver_id))
     if receiver_id:
         unread = Message.query.filter_by(receiver_id=current_user.id, sender_id=receiver_id, is_read=False).all()
         for msg in unread:
@@ -640,14 +654,14 @@ def messages(receiver_id=None):
             ((Message.sender_id == receiver_id) & (Message.receiver_id == current_user.id))
         ).order_by(Message.timestamp).all()
         receiver = User.query.get_or_404(receiver_id)
-    return render_template_string(MESSAGES_HTML, conversations=conversations, messages=messages, receiver=receiver, receiver_id=receiver_id)
+    return render_template('messages.html', conversations=conversations, messages=messages, receiver=receiver, receiver_id=receiver_id)
 
-@app.route('/send_message/<int:receiver_id>')
+@bp.route('/send_message/<int:receiver_id>')
 @login_required
 def send_message(receiver_id):
-    return redirect(url_for('messages', receiver_id=receiver_id))
+    return redirect(url_for('.messages', receiver_id=receiver_id))
 
-@app.route('/buy_points', methods=['GET', 'POST'])
+@bp.route('/buy_points', methods=['GET', 'POST'])
 @login_required
 @handle_db_errors
 def buy_points():
@@ -655,24 +669,107 @@ def buy_points():
         current_user.points += int(request.form['points'])
         db.session.commit()
         flash(f'Dodano punkty!')
-        return redirect(url_for('profile'))
-    return render_template_string(BUY_POINTS_HTML)
+        return redirect(url_for('.profile'))
+    return render_template('buy_points.html')
 
-@app.route('/clear_notifications')
+@bp.route('/clear_notifications')
 @login_required
 @handle_db_errors
 def clear_notifications():
     current_user.notifications = 0
     db.session.commit()
     flash('Powiadomienia wyczyszczone!')
-    return redirect(url_for('profile'))
-
-# Inicjalizacja bazy danych
-if __name__ == '__main__':
+    return redirect(url_for('.profile'))
+
+# Fabryka aplikacji
+def create_app(config=None):
+    start = time.perf_counter()
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'super-secret-key-123')
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///skillswap.db').replace('postgres://', 'postgresql://', 1)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['WARM_UP'] = os.getenv('WARM_UP', '1') != '0'
+    app.config['WARM_UP_CONNECTIONS'] = int(os.getenv('WARM_UP_CONNECTIONS', 2))
+    # DDL tylko w jednym procesie (master gunicorna z preload_app), nie w każdym workerze uvicorna
+    app.config['VERIFY_SCHEMA'] = os.getenv('VERIFY_SCHEMA', '1') != '0'
+    if config:
+        app.config.from_mapping(config)
+    app.jinja_loader = DictLoader(TEMPLATES)
+    db.init_app(app)
+    login_manager.init_app(app)
+    app.register_blueprint(bp)
+    if app.config['VERIFY_SCHEMA']:
+        init_db(app)
+    if app.config['WARM_UP']:
+        warm_up(app)
+    logging.info(f'Aplikacja utworzona w {(time.perf_counter() - start) * 1000:.1f} ms')
+    return app
+
+# Schemat bazy - niezależnie od WARM_UP, żeby nowa baza zawsze dostała tabele
+# Błędy startu (schemat, pula połączeń) przerywają uruchamianie serwera zamiast przyjmować ruch z niedziałającą bazą
+def init_db(app):
+    start = time.perf_counter()
     with app.app_context():
         try:
-            db.create_all()
+            verify_schema()
             logging.info("Baza danych zainicjalizowana.")
         except Exception as e:
             logging.error(f"Błąd inicjalizacji bazy danych: {str(e)}")
+            raise
+        finally:
+            # Połączenia nie mogą przejść przez fork - workery otwierają własne w prime_pools
+            db.engine.dispose()
+    logging.info(f'Schemat bazy sprawdzony w {(time.perf_counter() - start) * 1000:.1f} ms')
+
+# Rozgrzewka - w procesie głównym gunicorna (preload_app) przed forkiem workerów
+def warm_up(app):
+    start = time.perf_counter()
+    for name in TEMPLATES:
+        app.jinja_env.get_template(name)
+    logging.info(f'Rozgrzewka: szablony {(time.perf_counter() - start) * 1000:.1f} ms')
+
+def verify_schema():
+    db.create_all()
+    existing = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        names = {index['name'] for index in existing.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in names:
+                logging.warning(f'Brak indeksu {index.name} na {table.name} - tworzenie')
+                index.create(db.engine)
+
+# Wypełnienie puli połączeń - w każdym workerze, zanim zacznie przyjmować żądania
+def prime_pools(app):
+    if not app.config['WARM_UP']:
+        return
+    start = time.perf_counter()
+    with app.app_context():
+        try:
+            connections = [db.engine.connect() for _ in range(app.config['WARM_UP_CONNECTIONS'])]
+            for connection in connections:
+                connection.execute(text('SELECT 1'))
+                connection.close()
+        except Exception as e:
+            logging.error(f'Błąd wypełniania puli połączeń: {str(e)}')
+            raise
+        status = db.engine.pool.status()
+    logging.info(f'Pula połączeń gotowa w {(time.perf_counter() - start) * 1000:.1f} ms ({status})')
+
+# Sygnał gotowości workera dla benchmark.py - plik z READY_FILE powstaje dopiero po wypełnieniu puli,
+# bo gunicorn nasłuchuje na porcie, zanim workery skończą start
+def mark_ready():
+    if os.getenv('READY_FILE'):
+        open(os.getenv('READY_FILE'), 'a').close()
+
+# Zgodność wsteczna: `gunicorn skillswap:app` i `from skillswap import app` tworzą aplikację przy pierwszym użyciu
+def __getattr__(name):
+    if name == 'app':
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+if __name__ == '__main__':
+    app = create_app()
+    prime_pools(app)
     app.run(debug=True, host='0.0.0.0', port=5000)